@@ -1,104 +1,81 @@
 import streamlit as st
+from langchain_community.cache import SQLiteCache
 from langchain_community.retrievers import WikipediaRetriever
+from langchain_core.globals import set_llm_cache
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field
+import hashlib
+import logging
 import re
 import os
+import threading
+
+import httpx
+
+# Persist identical LLM calls across sessions; st.cache_data only lives
+# for the current process
+os.makedirs(".cache", exist_ok=True)
+set_llm_cache(SQLiteCache(database_path=".cache/llm.db"))
+
+logger = logging.getLogger(__name__)
+
+# Sidebar examples; by far the most likely inputs, so their pipeline
+# stages are pre-warmed in the background once an API key is available
+EXAMPLE_INDUSTRIES = [
+    "Healthcare",
+    "Semiconductors",
+    "Renewable Energy",
+    "E-commerce",
+    "Biotechnology",
+]
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+# Wikipedia boilerplate stripped from page content before prompting
+_CITATION_RE = re.compile(r"\[\d+\]")
+_SECTION_RE = re.compile(r"==+[^=\n]*==+")
+_WS_RE = re.compile(r"\s+")
+
+# Structured output schemas for the validator, planner, and title filter
+class ValidatePlanOut(BaseModel):
+    valid: bool = Field(description="True if the input refers to a business industry")
+    reason: str = Field(default="", description="One-sentence explanation when invalid")
+    suggestions: list[str] = Field(default_factory=list, description="3-5 specific industry alternatives when invalid")
+    queries: list[str] = Field(default_factory=list, description="Exactly 5 Wikipedia search queries when the input is valid")
+
+class SelectionOut(BaseModel):
+    selected: list[int] = Field(description="Numbers of the selected candidate titles")
+
+# Prompt templates are built once at import; Streamlit re-executes the
+# script on every widget change, so anything constructed per call is
+# rebuilt on every rerun
+_VALIDATE_PLAN_PROMPT = ChatPromptTemplate.from_template("""
+    You are an input validator and research query planner for a market
+    research assistant.
 
-# Page configuration
-st.set_page_config(
-    page_title="AI Market Research Assistant",
-    page_icon="📊",
-    layout="wide"
-)
-
-# Initialize LLM
-@st.cache_resource
-def get_llm(api_key, provider, model):
-    """Initialize the LLM with API key and provider"""
-    if provider == "Groq":
-        return ChatGroq(
-            model_name=model,
-            temperature=0.2,
-            max_tokens=3000,
-            max_retries=2,
-            api_key=api_key
-        )
-    else:  # OpenAI
-        return ChatOpenAI(
-            model=model,
-            temperature=0.2,
-            max_tokens=3000,
-            max_retries=2,
-            api_key=api_key
-        )
+    INDUSTRY:
+    "{user_input}"
 
-def validate_industry(user_input, llm):
-    """Validate if the input is a valid industry"""
-    industry_check_prompt = f"""
-    You are an input validator.
-    TASK:
-    Determine whether the "{user_input}" refers to a BUSINESS INDUSTRY, SECTOR, or MARKET.
-    
-    RULES:
+    STEP 1 — VALIDATE:
+    Determine whether the input refers to a BUSINESS INDUSTRY, SECTOR, or MARKET.
     - Accept industry names even if informal or simplified
-    - Only mark as INVALID if:
+    - Only mark as invalid if:
       1. It's a single generic product with no industry context
       2. It's not business-related at all (e.g., "my dog", "happiness", "purple")
-    - Be permissive — if it could reasonably refer to an industry, mark it VALID
-    
-    RESPOND IN THIS EXACT FORMAT:
-    
-    If the input clearly refers to an industry (even informally):
-    VALID
-    
-    If the input is too vague and needs clarification:
-    INVALID - [one sentence explanation]
-    SUGGESTIONS: [3-5 specific industry alternatives, comma-separated]
-    """
-    
-    classification_raw = llm.invoke(industry_check_prompt).content.strip()
-    classification = classification_raw.split()[0].upper()
-    
-    if classification == "VALID":
-        return True, "", []
-    else:
-        # Parse response for reason and suggestions
-        lines = classification_raw.split('\n')
-        reason = ""
-        suggestions = []
-        
-        for line in lines:
-            if line.startswith("INVALID"):
-                reason = line.replace("INVALID", "").replace("-", "").strip()
-            elif line.startswith("SUGGESTIONS:"):
-                suggestions_text = line.replace("SUGGESTIONS:", "").strip()
-                suggestions = [s.strip() for s in suggestions_text.split(",")]
-        
-        return False, reason, suggestions
+    - Be permissive — if it could reasonably refer to an industry, mark it valid
 
-def generate_queries(user_input, llm):
-    """Generate multiple search queries for the industry"""
-    setup_prompt = f"""
-   You are a research query planner for a market research assistant.
+    If the input is too vague, give a one-sentence reason and 3-5 specific
+    industry alternatives as suggestions, and leave the queries empty.
 
-    INDUSTRY:
-    "{user_input}"
-
-    OBJECTIVE:
-    Generate Wikipedia search queries that will retrieve pages useful for producing
-    a business-focused industry research report.
-
-    STRICT RULES:
-    - Every query MUST explicitly refer to the "{user_input}" industry or a very close synonym.
-    - Do NOT generate queries for adjacent or parent industries unless they explicitly include "{user_input}".
-    - Prefer canonical Wikipedia article titles over descriptive phrases.
-    - Avoid geography-only, company-only, or historical-only queries.
-    - Do NOT include future predictions or forecasts unless Wikipedia commonly covers them.
-
-    TASK:
-    Generate exactly 5 Wikipedia search queries, each targeting a distinct business dimension:
+    STEP 2 — PLAN (only if valid):
+    Generate exactly 5 Wikipedia search queries, each targeting a distinct
+    business dimension:
 
     1. Industry definition and scope
     2. Market structure and value chain
@@ -106,46 +83,15 @@ def generate_queries(user_input, llm):
     4. Economic significance or market size (if available)
     5. Industry trends, regulation, or structural change
 
-    FORMAT (EXACT):
-    QUERIES:
-    - <query 1>
-    - <query 2>
-    - <query 3>
-    - <query 4>
-    - <query 5>
-    """
-    setup_data = llm.invoke(setup_prompt).content.strip()
-    
-    queries = [
-        q.strip("- ").strip()
-        for q in setup_data.splitlines()
-        if q.strip().startswith("-")
-    ]
-    
-    return queries
-
-def retrieve_documents(queries):
-    """Retrieve documents from Wikipedia"""
-    retriever = WikipediaRetriever(load_max_docs=12, lang="en")
-    
-    all_docs = []
-    for q in queries:
-        all_docs.extend(retriever.invoke(q))
-    
-    # Deduplicate
-    unique_docs = {doc.metadata["title"]: doc for doc in all_docs}
-    return list(unique_docs.values())
-
-def filter_documents(raw_docs, user_input, llm):
-    """Filter and select the most relevant documents"""
-    if not raw_docs:
-        return []
-        
-    retriever = WikipediaRetriever(load_max_docs=20, lang="en")
+    STRICT RULES FOR QUERIES:
+    - Every query MUST explicitly refer to the "{user_input}" industry or a very close synonym.
+    - Do NOT generate queries for adjacent or parent industries unless they explicitly include "{user_input}".
+    - Prefer canonical Wikipedia article titles over descriptive phrases.
+    - Avoid geography-only, company-only, or historical-only queries.
+    - Do NOT include future predictions or forecasts unless Wikipedia commonly covers them.
+    """)
 
-    titles_list = [doc.metadata["title"] for doc in raw_docs]
-    
-    bouncer_prompt = f"""
+_BOUNCER_PROMPT = ChatPromptTemplate.from_template("""
     You are a source quality filter for a business market research tool.
 
   INDUSTRY:
@@ -157,131 +103,33 @@ def filter_documents(raw_docs, user_input, llm):
   - Are useful for business or market analysis
 
   RETURN FORMAT:
-  - Return ONLY the exact titles, separated by commas.
+  - Return ONLY the numbers of the selected titles.
   - Do NOT explain your reasoning.
 
   CANDIDATE TITLES:
   {titles_list}
-  """
-    
-    verified_titles = [
-        t.strip().lower()
-        for t in llm.invoke(bouncer_prompt).content.split(",")
-    ]
-    
-    final_docs = [
-        doc for doc in raw_docs
-        if any(v in doc.metadata["title"].lower() for v in verified_titles)
-    ]
-    
-    # Deduplicate by title
-    seen = set()
-    deduped_docs = []
-    
-    for doc in final_docs:
-        title = doc.metadata["title"]
-        if title not in seen:
-            seen.add(title)
-            deduped_docs.append(doc)
-    
-    final_docs = deduped_docs
-    
-    if len(final_docs) < 5:
-        print("[!] Expanding search scope...")
-        broad_queries = [
-            user_input,
-        f"{user_input} sector",
-        f"{user_input} services",
-        f"{user_input} market"
-        ]
-
-        # Search each broad query and add results
-        for q in broad_queries:
-            try:
-                docs = retriever.invoke(q)
-            except Exception:
-                continue  # Skip failed queries
-            for doc in docs:
-                title = doc.metadata["title"]
-                if title not in [d.metadata["title"] for d in final_docs]:
-                    if user_input.lower() in title.lower():
-                        final_docs.append(doc)
-                        
-    final_docs = final_docs[:5]
-
-    if not final_docs:
-        return [] # This stops the function immediately so no report is generated
-
-    return final_docs
-
-def generate_report(final_docs, user_input, llm):
-    """Generate the final industry report"""
-    context_text = ""
-    sources_info = []
-    
-    for i, doc in enumerate(final_docs, 1):
-        title = doc.metadata.get('title')
-        url = doc.metadata.get('source')
-        # Extract financial figures per source
-        per_source_prompt = f"""
-        You are a financial data extractor.
-        TASK:
-        Scan the SOURCE CONTENT below and extract ALL financial or market-scale figures, including market size, revenue, valuations, growth rates, investment amounts, market spending or similar.
-        
-        STRICT RULES:
-        - Extract ONLY figures explicitly stated in the content below.
-        - Do NOT calculate, estimate, or infer.
-        - Every bullet MUST follow this exact format:
-          • [figure] — [what it refers to, in plain English]
-          Example: • US$1.3 billion — Sri Lanka tea industry export revenue in 2021
-          Example: • 8.5% CAGR — projected annual growth rate of the global tea market
-        - Do NOT return bare numbers without context.
-        - If none found, return exactly: "None"
-        
-        SOURCE CONTENT:
-        {doc.page_content[:4000]}
-        """
-        try:
-            per_source_financials = llm.invoke(per_source_prompt).content.strip()
-        except Exception:
-            per_source_financials = "None"
-
-        sources_info.append({
-            "#": i,
-            "Title": title,
-            "URL": url,
-            "Financial Figures": per_source_financials
-        })
-
-        context_text += (
-            f"[SOURCE {i}]\n"
-            f"TITLE: {title}\n"
-            f"URL: {url}\n"
-            f"CONTENT:\n{doc.page_content[:4000]}\n\n"
-        )
-
-
-    # Combined financial summary for the report prompt
-    financial_text = "\n\n".join([
-        f"SOURCE {s['#']} — {s['Title']}:\n{s['Financial Figures']}"
-        for s in sources_info
-    ])
-    
-    report_prompt = ChatPromptTemplate.from_template("""
+  """)
+
+# The static report instructions live in the system message so every
+# report call shares an identical cacheable prefix regardless of
+# industry; the per-run industry and document context follow in the
+# user message.
+_REPORT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
     ROLE:
     You are a Market Research Assistant supporting business analysts at a large corporation.
 
     OBJECTIVE:
     Produce a concise, decision-oriented industry briefing that helps a corporate analyst
-    understand the structure, economics, risks, and strategic outlook of the {industry}.
+    understand the structure, economics, risks, and strategic outlook of the target industry.
 
     STRICT RULES:
-    - Use ONLY information explicitly contained in the CONTEXT below.
+    - Use ONLY information explicitly contained in the CONTEXT of the user message.
     - Every factual statement MUST end with at least one clickable citation in this format: [SOURCE X](URL).
     - Do NOT include assumptions, extrapolations, or forward-looking estimates unless directly supported by the sources.
     - Do NOT generalize about market size if exact figures are available.
     - Avoid generic business statements that could apply to most industries.
-    - You SHOULD incorporate the financial figures listed in FINANCIAL FIGURES only if appropriate and accurately.
+    - Report any financial or market-scale figures stated in the CONTEXT verbatim, with their citation.
 
     WRITING STYLE:
     - Professional, neutral, and analytical.
@@ -326,7 +174,7 @@ def generate_report(final_docs, user_input, llm):
     5. Key Industry Drivers
       - List 3–4 concrete drivers that influence industry performance.
       - Drivers should reflect structural, regulatory, technological, or demand-side forces 
-        specific to the {industry}.
+        specific to the target industry.
 
     6. Risks, Constraints & Regulatory Barriers
       - Identify capital requirements, cost structure, supply constraints, regulatory barriers, or systemic risks.
@@ -345,21 +193,345 @@ def generate_report(final_docs, user_input, llm):
 
     LENGTH:
     Maximum 500 words.
+    """),
+    ("human", """
+    INDUSTRY:
+    {industry}
 
     CONTEXT:
     {context}
-
-    FINANCIAL FIGURES:
-    {financials}
     """)
-    
-    report = (report_prompt | llm).invoke({
-        "context": context_text,
-        "industry": user_input,
-        "financials": financial_text
+])
+
+def clean_content(text, max_tokens=1000):
+    """Strip reference markers and section markup, then trim by tokens"""
+    text = _CITATION_RE.sub("", text)
+    text = _SECTION_RE.sub("", text)
+    text = _WS_RE.sub(" ", text).strip()
+    if _ENCODING is not None:
+        tokens = _ENCODING.encode(text)
+        if len(tokens) > max_tokens:
+            text = _ENCODING.decode(tokens[:max_tokens])
+    else:
+        text = text[:4000]
+    return text
+
+# Page configuration
+st.set_page_config(
+    page_title="AI Market Research Assistant",
+    page_icon="📊",
+    layout="wide"
+)
+
+# Initialize LLM
+@st.cache_resource
+def get_http_client():
+    """Keep-alive HTTP client shared by every LLM instance in the process"""
+    return httpx.Client(limits=httpx.Limits(max_keepalive_connections=20))
+
+@st.cache_resource
+def get_llm(api_key, provider, model):
+    """Initialize the LLM with API key and provider"""
+    if provider == "Groq":
+        return ChatGroq(
+            model_name=model,
+            temperature=0.2,
+            max_tokens=3000,
+            max_retries=2,
+            api_key=api_key,
+            http_client=get_http_client()
+        )
+    else:  # OpenAI
+        return ChatOpenAI(
+            model=model,
+            temperature=0.2,
+            max_tokens=3000,
+            max_retries=2,
+            api_key=api_key,
+            http_client=get_http_client()
+        )
+
+def _warmup_connections(provider, client):
+    """Seed DNS and TLS for the LLM provider and Wikipedia hosts"""
+    llm_host = "https://api.groq.com" if provider == "Groq" else "https://api.openai.com"
+    wiki_ping = "https://en.wikipedia.org/w/api.php?action=query&meta=siteinfo&format=json"
+
+    try:
+        # Going through the shared client parks the warmed connection in
+        # the same keep-alive pool the LLM instances use
+        client.get(llm_host, timeout=3)
+    except Exception:
+        pass  # Warmup is best-effort
+
+    try:
+        # Wikipedia is fetched by the wikipedia package's own session, so
+        # this only pre-warms DNS for the host
+        httpx.get(wiki_ping, timeout=3)
+    except Exception:
+        pass
+
+@st.cache_resource
+def start_warmup(provider):
+    """Warm remote hosts in the background, once per provider"""
+    threading.Thread(
+        target=_warmup_connections,
+        args=(provider, get_http_client()),
+        daemon=True
+    ).start()
+    return True
+
+def _warm_examples(provider, model, llm):
+    """Pre-populate the cheap pipeline stages for the example industries.
+
+    The report call itself is left cold on purpose — warming it would
+    spend a meaningful amount of the user's tokens on industries they may
+    never ask about.
+    """
+    for example in EXAMPLE_INDUSTRIES:
+        try:
+            industry = normalize_input(example)
+            is_valid, _, _, queries = validate_and_plan(industry, provider, model, llm)
+            if is_valid and queries:
+                raw_docs = retrieve_documents(queries)
+                filter_documents(raw_docs, industry, provider, model, llm)
+        except Exception:
+            logger.debug("Cache warm failed for %r", example, exc_info=True)
+
+@st.cache_resource
+def start_example_warmup(api_key, provider, model):
+    """Warm the example-industry caches in the background, once per config"""
+    llm = get_llm(api_key, provider, model)
+    threading.Thread(target=_warm_examples, args=(provider, model, llm), daemon=True).start()
+    return True
+
+def normalize_input(user_input):
+    """Normalize user input so equivalent spellings share one cache entry"""
+    return _WS_RE.sub(" ", user_input.strip().lower())
+
+@st.cache_data(show_spinner=False, ttl=86400)
+def validate_and_plan(user_input, provider, model, _llm):
+    """Validate the input and plan search queries in one LLM call.
+
+    Both tasks only need the raw input, so a single structured-output
+    prompt answers them together, halving the round-trips on this leg.
+    Results are cached per (input, provider, model).
+    """
+    # temperature=0 keeps this call deterministic so the persistent LLM
+    # cache and the st.cache_data entries stay sound; it must be set on
+    # the model copy — kwargs bound before with_structured_output are
+    # silently ignored
+    planner_llm = _llm.model_copy(update={"max_tokens": 256, "temperature": 0})
+    chain = _VALIDATE_PLAN_PROMPT | planner_llm.with_structured_output(ValidatePlanOut)
+    result = chain.invoke({"user_input": user_input})
+
+    if not result.valid:
+        return False, result.reason, result.suggestions, []
+    return True, "", [], result.queries[:5]
+
+@st.cache_resource
+def get_retriever(max_docs=5):
+    """Shared WikipediaRetriever so the underlying HTTP session is reused.
+
+    top_k_results caps how many pages each query fetches. Content is
+    capped at the default 4000 chars, which already covers everything
+    downstream reads: clean_content trims to ~1000 tokens and the
+    near-duplicate check hashes at most the first 6000 chars, so full
+    100KB pages would be wasted bytes.
+    """
+    return WikipediaRetriever(
+        top_k_results=max_docs,
+        lang="en",
+        doc_content_chars_max=4000
+    )
+
+@st.cache_data(show_spinner=False, ttl=86400)
+def retrieve_documents(queries):
+    """Retrieve documents from Wikipedia"""
+    retriever = get_retriever(max_docs=5)
+
+    # Each query is blocking HTTP; batch dispatches them concurrently and
+    # hands back exceptions per query instead of aborting the whole fetch
+    results = retriever.batch(
+        list(queries),
+        config={"max_concurrency": len(queries)},
+        return_exceptions=True
+    )
+
+    # Deduplicate by title, skipping queries that failed
+    unique_docs = {}
+    for docs in results:
+        if isinstance(docs, Exception):
+            continue
+        for doc in docs:
+            unique_docs.setdefault(doc.metadata["title"], doc)
+
+    return list(unique_docs.values())
+
+def _simhash(text, shingle_size=6, bits=64):
+    """64-bit SimHash over character shingles of the text"""
+    weights = [0] * bits
+    text = text.lower()
+    for i in range(max(len(text) - shingle_size + 1, 1)):
+        shingle = text[i:i + shingle_size].encode()
+        h = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for b in range(bits):
+            weights[b] += 1 if (h >> b) & 1 else -1
+    return sum(1 << b for b in range(bits) if weights[b] > 0)
+
+def _drop_near_duplicates(docs, hamming_threshold=12, sig_cache=None):
+    """Drop docs whose content is a near-duplicate of an earlier one.
+
+    Title dedup misses articles that cover the same ground under
+    different names (e.g. "Automotive industry" vs "Car industry");
+    comparing SimHash signatures by Hamming distance catches those.
+    Signatures cost tens of ms per doc, so callers that dedupe more than
+    once can pass a sig_cache dict to hash each doc only once.
+    """
+    if sig_cache is None:
+        sig_cache = {}
+
+    kept = []
+    signatures = []
+
+    for doc in docs:
+        title = doc.metadata["title"]
+        sig = sig_cache.get(title)
+        if sig is None:
+            sig = _simhash(doc.page_content[:6000])
+            sig_cache[title] = sig
+        if any(bin(sig ^ prior).count("1") <= hamming_threshold for prior in signatures):
+            continue
+        signatures.append(sig)
+        kept.append(doc)
+
+    return kept
+
+@st.cache_data(show_spinner=False, ttl=86400)
+def filter_documents(raw_docs, user_input, provider, model, _llm):
+    """Filter and select the most relevant documents.
+
+    Returns the selected docs and whether the broad-query expansion ran.
+    """
+    if not raw_docs:
+        return [], False
+
+    final_docs = []
+    seen_titles = set()
+    sig_cache = {}
+
+    # Score titles locally first; most inputs resolve without paying for
+    # the LLM bouncer at all
+    industry_terms = set(normalize_input(user_input).split())
+    if industry_terms:
+        scored = []
+        for doc in raw_docs:
+            title_terms = set(doc.metadata["title"].lower().split())
+            overlap = len(industry_terms & title_terms) / len(industry_terms)
+            if overlap >= 0.5:
+                scored.append((overlap, doc))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+
+        for _, doc in scored:
+            title = doc.metadata["title"]
+            if title not in seen_titles:
+                seen_titles.add(title)
+                final_docs.append(doc)
+
+    # Local scoring already found a full set — skip the LLM entirely
+    final_docs = _drop_near_duplicates(final_docs, sig_cache=sig_cache)
+    if len(final_docs) >= 5:
+        return final_docs[:5], False
+
+    # Fall back to the LLM bouncer when local scoring is inconclusive;
+    # cap the candidate list (retriever order) to bound the prompt size
+    candidates = raw_docs[:20]
+    titles_list = "\n".join(
+        f"{i}. {doc.metadata['title']}"
+        for i, doc in enumerate(candidates, 1)
+    )
+
+    bouncer_llm = _llm.model_copy(update={"max_tokens": 128})
+    chain = _BOUNCER_PROMPT | bouncer_llm.with_structured_output(SelectionOut)
+    result = chain.invoke({"user_input": user_input, "titles_list": titles_list})
+
+    # Indices map straight back to docs — no fuzzy title matching needed
+    for idx in result.selected[:5]:
+        if 1 <= idx <= len(candidates):
+            doc = candidates[idx - 1]
+            title = doc.metadata["title"]
+            if title not in seen_titles:
+                seen_titles.add(title)
+                final_docs.append(doc)
+
+    expanded = len(final_docs) < 5
+    if expanded:
+        logger.info("Expanding search scope for %r", user_input)
+        retriever = get_retriever(max_docs=3)
+        broad_queries = [
+            user_input,
+        f"{user_input} sector",
+        f"{user_input} services",
+        f"{user_input} market"
+        ]
+
+        # Search the broad queries in parallel and add results
+        broad_results = retriever.batch(
+            broad_queries,
+            config={"max_concurrency": len(broad_queries)},
+            return_exceptions=True
+        )
+
+        user_input_lower = user_input.lower()
+        for docs in broad_results:
+            if isinstance(docs, Exception):
+                continue
+            for doc in docs:
+                title = doc.metadata["title"]
+                if title not in seen_titles and user_input_lower in title.lower():
+                    seen_titles.add(title)
+                    final_docs.append(doc)
+
+    final_docs = _drop_near_duplicates(final_docs, sig_cache=sig_cache)[:5]
+
+    return final_docs, expanded
+
+def generate_report(final_docs, user_input, provider, model, llm):
+    """Generate the final industry report"""
+    sources_info = []
+    context_parts = []
+
+    # Clean each doc once so the report context doesn't pay for
+    # boilerplate tokens
+    contents = [clean_content(doc.page_content) for doc in final_docs]
+
+    for i, doc in enumerate(final_docs, 1):
+        title = doc.metadata.get('title')
+        url = doc.metadata.get('source')
+
+        sources_info.append({
+            "#": i,
+            "Title": title,
+            "URL": url
         })
-    
-    return report.content, sources_info, financial_text
+
+        context_parts.append(
+            f"[SOURCE {i}]\n"
+            f"TITLE: {title}\n"
+            f"URL: {url}\n"
+            f"CONTENT:\n{contents[i - 1]}\n\n"
+        )
+
+    context_text = "".join(context_parts)
+
+    # Stream tokens as they arrive so the UI can render the report incrementally
+    def report_stream():
+        for chunk in (_REPORT_PROMPT | llm.bind(max_tokens=1400)).stream({
+            "context": context_text,
+            "industry": user_input
+            }):
+            yield chunk.content
+
+    return report_stream(), sources_info
 
 # Streamlit UI
 # Logo + Title
@@ -395,7 +567,11 @@ with st.sidebar:
             help="Select OpenAI model"
         )
         api_url = "https://platform.openai.com/api-keys"
-    
+
+    # Warm connections to the provider and Wikipedia while the user is
+    # still filling in the sidebar
+    start_warmup(provider)
+
     # API Key Input
     api_key = st.text_input(
         f"{provider} API Key",
@@ -405,6 +581,8 @@ with st.sidebar:
     
     if api_key:
         st.success("✅ API Key provided")
+        # Pre-warm the example industries so their first click is fast
+        start_example_warmup(api_key, provider, model)
     else:
         st.warning(f"⚠️ Please enter your {provider} API key")
     
@@ -425,13 +603,7 @@ with st.sidebar:
     """)
     
     st.header("Examples")
-    st.markdown("""
-    - Healthcare
-    - Semiconductors
-    - Renewable Energy
-    - E-commerce
-    - Biotechnology
-    """)
+    st.markdown("\n".join(f"- {example}" for example in EXAMPLE_INDUSTRIES))
 
 # Main input
 user_input = st.text_input(
@@ -455,11 +627,13 @@ if st.button("Generate Report", type="primary"):
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            # Step 1: Validate industry
+            # Step 1: Validate industry & plan queries (run concurrently)
             status_text.text("🔍 Validating industry...")
             progress_bar.progress(10)
-            
-            is_valid, reason, suggestions = validate_industry(user_input, llm)
+
+            industry = normalize_input(user_input)
+
+            is_valid, reason, suggestions, queries = validate_and_plan(industry, provider, model, llm)
 
             if not is_valid:
                 st.error(f"'{user_input}' does not appear to be a valid industry.")
@@ -471,12 +645,10 @@ if st.button("Generate Report", type="primary"):
                         st.write(f"• {s}")
                 st.stop()
             
-            # Step 2: Generate queries
+            # Step 2: Show the queries planned during validation
             status_text.text("📝 Generating search queries...")
             progress_bar.progress(25)
-            
-            queries = generate_queries(user_input, llm)
-            
+
             with st.expander("View Generated Queries"):
                 for i, q in enumerate(queries, 1):
                     st.write(f"{i}. {q}")
@@ -499,7 +671,7 @@ if st.button("Generate Report", type="primary"):
             status_text.text("🔎 Filtering relevant sources...")
             progress_bar.progress(70)
             
-            final_docs = filter_documents(raw_docs, user_input, llm)
+            final_docs, expanded = filter_documents(raw_docs, industry, provider, model, llm)
             
             if not final_docs:
                 st.warning(f"""
@@ -513,36 +685,34 @@ if st.button("Generate Report", type="primary"):
                 - A different but related sector
                 """)
                 st.stop()
-            
+
+            if expanded:
+                st.info("ℹ️ Search scope was expanded to find enough relevant sources.")
+
             # Step 5: Generate report
             status_text.text("✍️ Generating report...")
             progress_bar.progress(90)
             
-            report_content, sources_info, financial_text = generate_report(final_docs, user_input, llm)
-            
-            progress_bar.progress(100)
-            status_text.text("✅ Report generated successfully!")
-            
-            # Display results
-            st.success("Report generated successfully!")
-            
-            # Sources + Financial figures combined
-            st.subheader("📚 Verified Sources & Financial Figures")
+            report_stream, sources_info = generate_report(final_docs, industry, provider, model, llm)
+
+            # Sources (financial figures are cited inline in the report)
+            st.subheader("📚 Verified Sources")
             for s in sources_info:
                 with st.expander(f"SOURCE {s['#']}: {s['Title']}"):
                     st.markdown(f"🔗 [{s['URL']}]({s['URL']})")
-                    st.markdown("**💰 Financial Figures:**")
-                    if s['Financial Figures'] == "None":
-                        st.caption("No explicit financial figures found in this source.")
-                    else:
-                        formatted = s['Financial Figures'].replace('• ', '\n\n• ')
-                        st.markdown(formatted)
-            
+
             # Report section
             st.subheader(f"📊 Industry Report: {user_input.upper()}")
             st.markdown("---")
-            st.markdown(report_content)
-            
+            # Renders tokens as they arrive and returns the full concatenated
+            # text; the stream is lazy, so success is only reported after
+            # this returns without raising
+            report_content = st.write_stream(report_stream)
+
+            progress_bar.progress(100)
+            status_text.text("✅ Report generated successfully!")
+            st.success("Report generated successfully!")
+
             # Download button
             st.download_button(
                 label="📥 Download Report",